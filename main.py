@@ -3,35 +3,81 @@ main.py
 Master runner that executes:
 1. Job scraping + auto-apply
 2. Contact discovery + outreach prep
+
+Contact lookups for applied companies start while step 1 is still applying,
+so most of step 2 is served from the contact cache once the sheet is ready.
 """
 
 import subprocess
 import sys
 import os
+import traceback
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
 
 SRC_DIR = "src"
+sys.path.insert(0, SRC_DIR)
 
 def run_script(script_path):
     """Run another Python script and stream logs."""
     print(f"\n⚡ Running {script_path} ...\n")
-    result = subprocess.run([sys.executable, script_path], capture_output=True, text=True)
+    # -u: the child's stdout is a pipe, so without it print() output would only arrive at exit
+    proc = subprocess.Popen([sys.executable, "-u", script_path], stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT, text=True, bufsize=1)
+    for line in proc.stdout:
+        print(line, end="", flush=True)
+    proc.wait()
 
-    if result.returncode != 0:
-        print(f"❌ {script_path} failed:\n{result.stderr}")
+    if proc.returncode != 0:
+        print(f"❌ {script_path} failed (exit code {proc.returncode})")
     else:
-        print(f"✅ {script_path} finished successfully:\n{result.stdout}")
+        print(f"✅ {script_path} finished successfully")
+
+
+def run_job_applier(applied_queue):
+    """Scrape + auto-apply, publishing each applied company to `applied_queue`."""
+    try:
+        import Job_applier
+        Job_applier.main(on_applied=lambda job: applied_queue.put(job.company))
+    finally:
+        # sentinel: tells the contact prefetcher no more companies are coming
+        applied_queue.put(None)
+
+
+def prefetch_contacts(applied_queue):
+    """Look up contacts for companies as soon as they are applied to."""
+    import Contact
+    Contact.prefetch(applied_queue)
 
 
 def main():
-    # Step 1 + 2: Scraping & Auto-apply
     scraper_file = os.path.join(SRC_DIR, "Job_applier.py")
+    contact_file = os.path.join(SRC_DIR, "Contact.py")
+
+    # Step 1 + 2: Scraping & Auto-apply, overlapped with contact prefetching
     if os.path.exists(scraper_file):
-        run_script(scraper_file)
+        print(f"\n⚡ Running {scraper_file} ...\n")
+        with mp.Manager() as manager, ProcessPoolExecutor(max_workers=2) as ex:
+            applied_queue = manager.Queue()
+            stages = {
+                scraper_file: ex.submit(run_job_applier, applied_queue),
+                contact_file: ex.submit(prefetch_contacts, applied_queue),
+            }
+            failed = False
+            for name, fut in stages.items():
+                try:
+                    fut.result()
+                except Exception as e:
+                    failed = True
+                    print(f"❌ {name} failed:")
+                    # includes the worker-side traceback the pool chains as __cause__
+                    traceback.print_exception(e)
+        if not failed:
+            print(f"✅ {scraper_file} finished successfully")
     else:
         print("❌ job_scraper_apply.py not found in src/!")
 
     # Step 3 + 5: Contact Discovery + Outreach
-    contact_file = os.path.join(SRC_DIR, "Contact.py")
     if os.path.exists(contact_file):
         run_script(contact_file)
     else:
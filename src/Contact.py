@@ -1,7 +1,12 @@
 # ...existing code...
 import os
 import re
-import requests
+import time
+import shelve
+import asyncio
+import functools
+import aiohttp
+import orjson
 import pandas as pd
 from dotenv import load_dotenv
 
@@ -15,26 +20,141 @@ SNOV_API_SECRET = os.getenv("SNOV_API_SECRET")
 CLEARBIT_API_KEY = os.getenv("CLEARBIT_API_KEY")
 
 EXCEL_FILE = "jobs_with_status.xlsx"
+INTERMEDIATE = "jobs_with_status.feather"
 OUTPUT_FILE = "jobs_with_contacts.xlsx"
+OUTPUT_INTERMEDIATE = "jobs_with_contacts.feather"
+# Also write the (slower) xlsx copy for human review
+EXPORT_XLSX = os.getenv("EXPORT_XLSX", "True").lower() in ("1", "true", "yes")
+
+# Max simultaneous connections shared by all API lookups
+HTTP_CONCURRENCY = 50
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=10)
+HTTP_HEADERS = {"User-Agent": "Automated-Application/1.0"}
+# Max companies being looked up at the same time
+LOOKUP_CONCURRENCY = int(os.getenv("LOOKUP_CONCURRENCY", "16"))
+
+# Retry policy for transient API failures
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Outbound calls per second allowed for each API provider
+API_CALLS_PER_SEC = 10
+
+# Lookup cache, reused across runs (seconds)
+CACHE_FILE = os.getenv("CONTACT_CACHE_FILE", "contact_cache")
+CACHE_TTL = int(os.getenv("CONTACT_CACHE_TTL", str(7 * 24 * 3600)))
+# "API found nothing" answers are cached too, but rechecked sooner
+EMPTY_CACHE_TTL = int(os.getenv("CONTACT_EMPTY_CACHE_TTL", str(24 * 3600)))
+_MEMO = {}
 
 # ---------------------
 # Email validation
 # ---------------------
-def is_valid_email(email: str) -> bool:
-    if not email:
-        return False
-    pattern = r"^[\w\.-]+@[\w\.-]+\.\w+$"
-    return re.match(pattern, email) is not None
+EMAIL_RE = re.compile(r"^[\w\.-]+@[\w\.-]+\.\w+$")
+
+def valid_emails(mails) -> tuple:
+    """
+    Validate a whole batch of candidate emails in one vectorized pass.
+    """
+    # Cheap structural checks reject most bad values before the regex runs
+    s = pd.Series([m for m in mails if isinstance(m, str) and "@" in m and "." in m.rsplit("@", 1)[-1]],
+                  dtype=object)
+    if s.empty:
+        return ()
+    return tuple(s[s.str.match(EMAIL_RE)])
+
+# ---------------------
+# HTTP helper
+# ---------------------
+async def request_json(session: aiohttp.ClientSession, method: str, url: str, **kwargs):
+    """
+    Send a request on the shared session and return the decoded JSON body,
+    {} on a 404 (the API found nothing), or None on any other non-200 response.
+    Retries 429/5xx, connection errors and timeouts with exponential backoff.
+    """
+    for attempt in range(RETRY_TOTAL + 1):
+        try:
+            async with session.request(method, url, **kwargs) as r:
+                if r.status == 200:
+                    return orjson.loads(await r.read())
+                if r.status == 404:
+                    return {}
+                if r.status not in RETRY_STATUSES:
+                    return None
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt == RETRY_TOTAL:
+                raise
+        # back off outside the `async with` so the pooled connection is released while waiting
+        if attempt < RETRY_TOTAL:
+            await asyncio.sleep(RETRY_BACKOFF * (2 ** attempt))
+    return None
+
+# ---------------------
+# Rate limiting
+# ---------------------
+def rate_limited(calls_per_sec: float):
+    """
+    Token-bucket throttle for an async API helper.
+    Each call takes one token; when the bucket is empty the call sleeps until its token refills.
+    """
+    bucket = {"tokens": float(calls_per_sec), "updated": time.monotonic()}
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            now = time.monotonic()
+            bucket["tokens"] = min(calls_per_sec, bucket["tokens"] + (now - bucket["updated"]) * calls_per_sec)
+            bucket["updated"] = now
+            bucket["tokens"] -= 1
+            if bucket["tokens"] < 0:
+                await asyncio.sleep(-bucket["tokens"] / calls_per_sec)
+            return await fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+# ---------------------
+# Lookup cache
+# ---------------------
+def cached_lookup(api: str):
+    """
+    Memoize an async API helper on (api, normalized company, extra args).
+    Hits are served from memory first, then from the on-disk shelve if younger than CACHE_TTL
+    (EMPTY_CACHE_TTL for empty answers). Helpers return None when the lookup itself failed;
+    those are only kept in memory so they are retried on the next run.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(session, company: str, *args):
+            key = "|".join([api, company.strip().lower()] + [str(a) for a in args])
+            if key in _MEMO:
+                return _MEMO[key]
+            with shelve.open(CACHE_FILE) as db:
+                hit = db.get(key)
+            if hit and time.time() - hit[0] < (CACHE_TTL if hit[1] else EMPTY_CACHE_TTL):
+                _MEMO[key] = hit[1]
+                return hit[1]
+            result = await fn(session, company, *args)
+            _MEMO[key] = result
+            if result is not None:
+                with shelve.open(CACHE_FILE) as db:
+                    db[key] = (time.time(), result)
+            return result
+        return wrapper
+    return decorator
 
 # ---------------------
 # Hunter.io API
 # ---------------------
-def hunter_domain_search(company: str, domain_hint=None):
+@cached_lookup("hunter")
+@rate_limited(API_CALLS_PER_SEC)
+async def hunter_domain_search(session: aiohttp.ClientSession, company: str, domain_hint=None):
     """
     Fetch recruiter/company emails using Hunter.io API.
+    Returns () when Hunter found none, None when the lookup could not be made.
     """
     if not HUNTER_API_KEY:
-        return []
+        return None
     base_url = "https://api.hunter.io/v2/domain-search"
     params = {
         "company": company,
@@ -44,119 +164,178 @@ def hunter_domain_search(company: str, domain_hint=None):
     if domain_hint:
         params["domain"] = domain_hint
     try:
-        r = requests.get(base_url, params=params, timeout=10)
-        if r.status_code == 200:
-            data = r.json()
-            emails = []
-            for e in data.get("data", {}).get("emails", []):
-                mail = e.get("value")
-                if is_valid_email(mail):
-                    emails.append(mail)
-            return emails
+        data = await request_json(session, "GET", base_url, params=params)
+        if data is not None:
+            return valid_emails(e.get("value") for e in (data.get("data") or {}).get("emails", []))
     except Exception:
         pass
-    return []
+    return None
 
 # ---------------------
 # Snov.io API
 # ---------------------
-def snov_domain_search(company: str, domain_hint=None):
+@cached_lookup("snov")
+@rate_limited(API_CALLS_PER_SEC)
+async def snov_domain_search(session: aiohttp.ClientSession, company: str, domain_hint=None):
     """
     Fetch emails using Snov.io API.
+    Returns () when Snov (or Clearbit, for the domain) found nothing, None when the lookup failed.
     """
     if not SNOV_API_USER or not SNOV_API_SECRET:
-        return []
+        return None
     # Get access token
     try:
-        token_resp = requests.post(
+        token_data = await request_json(
+            session, "POST",
             "https://api.snov.io/v1/oauth/access_token",
             data={
                 "grant_type": "client_credentials",
                 "client_id": SNOV_API_USER,
                 "client_secret": SNOV_API_SECRET
-            },
-            timeout=10
+            }
         )
-        if token_resp.status_code != 200:
-            return []
-        access_token = token_resp.json().get("access_token")
+        if token_data is None:
+            return None
+        access_token = token_data.get("access_token")
         if not access_token:
-            return []
+            return None
         # Use domain search
-        domain = domain_hint or ""
-        if not domain:
+        domain = domain_hint
+        if domain is None:
             # Try to get domain from company name using Clearbit
-            domain = clearbit_domain_lookup(company)
+            domain = await clearbit_domain_lookup(session, company)
+        if domain is None:
+            return None
         if not domain:
-            return []
+            return ()
         headers = {"Authorization": f"Bearer {access_token}"}
         params = {"domain": domain, "type": "all", "limit": 5}
-        r = requests.get("https://api.snov.io/v2/domain-emails-with-info", headers=headers, params=params, timeout=10)
-        if r.status_code == 200:
-            data = r.json()
-            emails = []
-            for e in data.get("emails", []):
-                mail = e.get("email")
-                if is_valid_email(mail):
-                    emails.append(mail)
-            return emails
+        data = await request_json(session, "GET", "https://api.snov.io/v2/domain-emails-with-info", headers=headers, params=params)
+        if data is not None:
+            return valid_emails(e.get("email") for e in data.get("emails", []))
     except Exception:
         pass
-    return []
+    return None
 
 # ---------------------
 # Clearbit API (domain lookup only)
 # ---------------------
-def clearbit_domain_lookup(company: str):
+@cached_lookup("clearbit")
+@rate_limited(API_CALLS_PER_SEC)
+async def clearbit_domain_lookup(session: aiohttp.ClientSession, company: str):
     """
-    Use Clearbit to get the domain for a company.
+    Use Clearbit to get the domain for a company ("" if Clearbit knows none, None if the lookup failed).
     """
     if not CLEARBIT_API_KEY:
         return None
     try:
         headers = {"Authorization": f"Bearer {CLEARBIT_API_KEY}"}
         params = {"name": company}
-        r = requests.get("https://company.clearbit.com/v2/companies/find", headers=headers, params=params, timeout=10)
-        if r.status_code == 200:
-            data = r.json()
-            return data.get("domain")
+        data = await request_json(session, "GET", "https://company.clearbit.com/v2/companies/find", headers=headers, params=params)
+        if data is not None:
+            return data.get("domain") or ""
     except Exception:
         pass
     return None
 
+# ---------------------
+# Lookup orchestration
+# ---------------------
+async def hunter_provider(session: aiohttp.ClientSession, company: str, ctx: dict):
+    return await hunter_domain_search(session, company)
+
+async def clearbit_snov_provider(session: aiohttp.ClientSession, company: str, ctx: dict):
+    # Resolve the domain via Clearbit first; it doubles as the fallback contact
+    ctx["domain"] = await clearbit_domain_lookup(session, company)
+    return await snov_domain_search(session, company, ctx["domain"])
+
+# Tried in order until one returns emails
+PROVIDERS = [hunter_provider, clearbit_snov_provider]
+
+async def lookup(session: aiohttp.ClientSession, company: str) -> str:
+    """
+    Resolve recruiter contacts for one company by trying each of PROVIDERS in turn.
+    Falls back to the company domain (or "N/A") when no email is found.
+    """
+    ctx = {"domain": None}
+    for provider in PROVIDERS:
+        emails = await provider(session, company, ctx)
+        if emails:
+            return ", ".join(emails)
+    return ctx["domain"] or "N/A"
+
+def open_session() -> aiohttp.ClientSession:
+    """
+    Create the pooled session shared by every lookup in a run.
+    """
+    connector = aiohttp.TCPConnector(limit=HTTP_CONCURRENCY)
+    return aiohttp.ClientSession(connector=connector, timeout=HTTP_TIMEOUT, headers=HTTP_HEADERS)
+
+async def bounded_lookup(session: aiohttp.ClientSession, slots: asyncio.Semaphore, company: str) -> str:
+    async with slots:
+        return await lookup(session, company)
+
+async def lookup_all(companies):
+    """
+    Run lookups for all companies concurrently over one pooled session,
+    at most LOOKUP_CONCURRENCY at a time.
+    Results are returned in the same order as `companies`.
+    """
+    slots = asyncio.Semaphore(LOOKUP_CONCURRENCY)
+    async with open_session() as session:
+        return await asyncio.gather(*(bounded_lookup(session, slots, c) for c in companies))
+
+async def _prefetch(companies_queue):
+    slots = asyncio.Semaphore(LOOKUP_CONCURRENCY)
+    seen = set()
+    tasks = []
+    async with open_session() as session:
+        while True:
+            company = await asyncio.to_thread(companies_queue.get)
+            if company is None:
+                break
+            if company in seen:
+                continue
+            seen.add(company)
+            tasks.append(asyncio.create_task(bounded_lookup(session, slots, company)))
+        await asyncio.gather(*tasks)
+
+def prefetch(companies_queue):
+    """
+    Warm the lookup cache while Job_applier.py is still applying.
+    Consumes company names from `companies_queue` until a None sentinel arrives.
+    """
+    asyncio.run(_prefetch(companies_queue))
+
 # ---------------------
 # Main pipeline
 # ---------------------
 def main():
-    df = pd.read_excel(EXCEL_FILE)
-    recruiter_contacts = []
-
-    for _, row in df.iterrows():
-        status = str(row.get("status", "")).lower()
-        company = str(row.get("company", ""))
-        domain_hint = None
-
-        emails = []
-        if status == "applied":
-            # Try Hunter.io first
-            emails = hunter_domain_search(company)
-            # If Hunter fails, try Snov.io
-            if not emails:
-                # Try to get domain from Clearbit if possible
-                domain_hint = clearbit_domain_lookup(company)
-                emails = snov_domain_search(company, domain_hint)
-            # If still no emails, try Clearbit for domain (for reference)
-            if not emails and not domain_hint:
-                domain_hint = clearbit_domain_lookup(company)
-            email_str = ", ".join(emails) if emails else (domain_hint if domain_hint else "N/A")
-        else:
-            email_str = ""
-
-        recruiter_contacts.append(email_str)
-
-    df["Recruiter Contacts"] = recruiter_contacts
-    df.to_excel(OUTPUT_FILE, index=False)
-    print(f"✅ Saved file with recruiter contacts → {OUTPUT_FILE}")
+    # Job_applier writes both; prefer the fast feather copy unless the xlsx was edited since
+    # (e.g. statuses updated by hand after applying manually)
+    if os.path.exists(INTERMEDIATE) and (not os.path.exists(EXCEL_FILE)
+                                         or os.path.getmtime(INTERMEDIATE) >= os.path.getmtime(EXCEL_FILE)):
+        df = pd.read_feather(INTERMEDIATE, dtype_backend="pyarrow")
+    else:
+        df = pd.read_excel(EXCEL_FILE, dtype_backend="pyarrow")
+
+    # Lower-case status once per column instead of per row
+    fields = df.reindex(columns=["status", "company"], fill_value="").astype("string[pyarrow]").fillna("")
+    applied = fields["status"].str.lower() == "applied"
+
+    # Query each company once, then broadcast the result to all of its applied rows
+    to_query = fields.loc[applied, "company"].unique().tolist()
+    contacts_map = dict(zip(to_query, asyncio.run(lookup_all(to_query)))) if to_query else {}
+
+    df["Recruiter Contacts"] = fields["company"].map(contacts_map).where(applied, "")
+    df.to_feather(OUTPUT_INTERMEDIATE)
+    print(f"✅ Saved file with recruiter contacts → {OUTPUT_INTERMEDIATE}")
+    if EXPORT_XLSX:
+        # constant_memory flushes rows as written; URL/formula sniffing is unneeded for plain text
+        with pd.ExcelWriter(OUTPUT_FILE, engine="xlsxwriter", engine_kwargs={"options": {
+                "constant_memory": True, "strings_to_urls": False, "strings_to_formulas": False}}) as w:
+            df.to_excel(w, index=False)
+        print(f"✅ Saved file with recruiter contacts → {OUTPUT_FILE}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
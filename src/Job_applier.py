@@ -7,7 +7,8 @@ Full pipeline:
 - Filter by resume keywords (extracted from user's CV)
 - Parse/keep salary (N/A if absent)
 - Attempt auto-login (cookies re-used) and auto-apply (best-effort) where feasible
-- Export jobs_raw.xlsx and jobs_with_status.xlsx (status in {Applied, Pending, Flagged})
+- Export jobs_raw.parquet and jobs_with_status.xlsx (status in {Applied, Pending, Flagged}),
+  plus jobs_with_status.feather as the intermediate read by Contact.py
 """
 
 import os
@@ -15,12 +16,22 @@ import re
 import time
 import random
 import logging
+import functools
+import multiprocessing
+import multiprocessing.util
+import queue
 import pickle
-from dataclasses import dataclass, asdict
-from typing import List, Tuple, Optional, Dict, Set
-from urllib.parse import urljoin, quote_plus
+import tempfile
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Tuple, Optional, Dict, Set, Callable
+from urllib.parse import urljoin, quote_plus, urlsplit, urlunsplit, parse_qsl, urlencode
 
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import pandas as pd
 from dotenv import load_dotenv
@@ -32,8 +43,14 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 
+# Playwright (read-only search page scans)
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+
 # -------------- CONFIG / CREDENTIALS --------------
 load_dotenv()
 
@@ -52,13 +69,20 @@ CREDENTIALS = {
 }
 
 HEADLESS = os.getenv("HEADLESS", "True").lower() in ("1", "true", "yes")
+# Number of Chrome instances applying in parallel
+APPLY_WORKERS = int(os.getenv("APPLY_WORKERS", "3"))
+# Chrome profile reused across runs (disk cache + session cookies); each apply worker gets "<dir>-<n>".
+# Set to "" for throwaway profiles.
+PROFILE_DIR = os.getenv("CHROME_PROFILE_DIR", os.path.join(tempfile.gettempdir(), "autoapply_profile"))
+# Load images/CSS/fonts in the apply drivers (for forms that misbehave on unstyled pages)
+RENDER_APPLY_PAGES = os.getenv("RENDER_APPLY_PAGES", "False").lower() in ("1", "true", "yes")
 
 # Keywords from your resume (from the CVs you provided)
 RESUME_KEYWORDS = [
     "machine learning", "deep learning", "computer vision", "opencv", "image processing",
     "embedded", "tinyml", "edge ai", "esp32", "esp32-s3", "esp-idf", "ros", "robotics",
     "autonomous", "yolov5", "open3d", "lidar", "python", "c++", "tensorflow", "keras",
-    "scikit-learn", "edge impulse", "tinyml", "embedded systems", "microcontroller", "esp32"
+    "scikit-learn", "edge impulse", "embedded systems", "microcontroller"
 ]
 
 # Salary cutoffs (monthly). India = ₹70,000/month
@@ -81,11 +105,20 @@ USER_AGENTS = [
 
 HEADERS = {"User-Agent": random.choice(USER_AGENTS)}
 
+# Shared HTTP session: keep-alive + connection pooling for all requests-based scrapers
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                       max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]))
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+SESSION.headers.update(HEADERS)
+
 # Logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 
 # -------------- DATA MODEL --------------
-@dataclass
+# slots: no per-instance __dict__ (thousands of these are held at once); needs Python 3.10+
+@dataclass(slots=True)
 class JobPost:
     company: str
     role: str
@@ -96,9 +129,24 @@ class JobPost:
     remote: str = "Unknown"
     description_snippet: str = ""
     status: str = "Pending"   # Applied, Pending, Flagged
+    # lower-cased/stripped text fields, filled on first use by norm()
+    _norm: Optional[Dict[str, str]] = field(default=None, repr=False, compare=False)
+
+    def norm(self) -> Dict[str, str]:
+        """
+        Normalized (stripped, lower-cased) role/company/location/snippet, computed once per job
+        and shared by every filter. "text" is the three fields the resume filter searches.
+        """
+        if self._norm is None:
+            n = {k: normalize_text(getattr(self, k)).lower()
+                 for k in ("role", "company", "location", "description_snippet")}
+            n["text"] = " ".join((n["role"], n["company"], n["description_snippet"]))
+            self._norm = n
+        return self._norm
 
-    def dedupe_key(self) -> Tuple[str, str, str, str]:
-        return (self.company.strip().lower(), self.role.strip().lower(), self.location.strip().lower(), self.link.strip())
+    def dedupe_key(self) -> str:
+        return "|".join(((self.company or "").strip().lower(), (self.role or "").strip().lower(),
+                         (self.location or "").strip().lower(), (self.link or "").strip()))
 
 # -------------- HELPERS --------------
 def sleep_jitter(base=0.7, jitter=0.8):
@@ -113,28 +161,35 @@ CURRENCY_SYMBOLS = {
     "INR": "INR", "USD": "USD", "EUR": "EUR", "GBP": "GBP"
 }
 
+# Salary regexes, compiled once
+_SALARY_TRANS = str.maketrans({",": None, "—": "-", "–": "-"})   # drop separators, unify dashes
+_RE_CURRENCY = re.compile("|".join(map(re.escape, CURRENCY_SYMBOLS)))
+_RE_RANGE = re.compile(r"(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)")
+_RE_NUM = re.compile(r"\d+(?:\.\d+)?")
+_RE_YEARLY = re.compile(r"per\s*year|per\s*annum|pa|p\.a\.|annually|annual|yearly", re.I)
+_RE_MONTHLY = re.compile(r"per\s*month|/month|monthly|month", re.I)
+
+@functools.lru_cache(maxsize=4096)
 def extract_salary_numbers(text: str):
     if not text: return None
-    s = text.replace(",", "").replace("—", "-").replace("–","-")
-    currency = None
-    for sym, code in CURRENCY_SYMBOLS.items():
-        if sym in s:
-            currency = code
-            break
+    s = text.translate(_SALARY_TRANS)
+    # one pass over the text instead of one `in` scan per symbol
+    m = _RE_CURRENCY.search(s)
+    currency = CURRENCY_SYMBOLS[m.group(0)] if m else None
     # find numeric groups and ranges
-    range_match = re.search(r"(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)", s)
-    nums = re.findall(r"\d+(?:\.\d+)?", s)
+    range_match = _RE_RANGE.search(s)
     if range_match:
         low = float(range_match.group(1))
-    elif nums:
-        low = float(nums[0])
     else:
-        return None
+        num = _RE_NUM.search(s)
+        if not num:
+            return None
+        low = float(num.group(0))
     # detect unit
     unit = "monthly"
-    if re.search(r"per\s*year|per\s*annum|pa|p\.a\.|annually|annual|yearly", s, re.I):
+    if _RE_YEARLY.search(s):
         unit = "yearly"
-    if re.search(r"per\s*month|/month|monthly|month", s, re.I):
+    if _RE_MONTHLY.search(s):
         unit = "monthly"
     monthly = low
     if unit == "yearly":
@@ -147,24 +202,25 @@ def extract_salary_numbers(text: str):
             monthly = low / 12.0
     return monthly, currency or "UNKNOWN", unit
 
-def meets_cutoff(job: JobPost) -> bool:
-    if not job.salary or job.salary.upper() in ("N/A", "NOT PROVIDED", ""):
+# Country names from SALARY_CUTOFFS as one alternation: a single scan of the location text
+# (zero-width lookahead so overlapping names are all reported, like the per-country `in` checks)
+_RE_COUNTRY = re.compile("(?=(%s))" % "|".join(re.escape(c) for c in SALARY_CUTOFFS if c != "default"))
+
+@functools.lru_cache(maxsize=4096)
+def _salary_meets_cutoff(salary: str, location: str) -> bool:
+    if not salary or salary.upper() in ("N/A", "NOT PROVIDED", ""):
         return True
-    parsed = extract_salary_numbers(job.salary)
+    parsed = extract_salary_numbers(salary)
     if not parsed:
         return True
     monthly_val, currency, unit = parsed
     # guess cutoff by location text
-    loc = (job.location or "").lower()
-    cutoff = SALARY_CUTOFFS.get("default", 0)
-    for country, val in SALARY_CUTOFFS.items():
-        if country == "default":
-            continue
-        if country in loc:
-            cutoff = val
-            break
+    default = SALARY_CUTOFFS.get("default", 0)
+    # location is already lower-cased by JobPost.norm(); SALARY_CUTOFFS order decides between matches
+    found = set(_RE_COUNTRY.findall(location))
+    cutoff = next((v for c, v in SALARY_CUTOFFS.items() if c in found), default)
     # fallback from currency
-    if cutoff == SALARY_CUTOFFS.get("default", 0):
+    if cutoff == default:
         if currency == "INR":
             cutoff = SALARY_CUTOFFS.get("india", cutoff)
         elif currency == "USD":
@@ -175,15 +231,64 @@ def meets_cutoff(job: JobPost) -> bool:
             cutoff = SALARY_CUTOFFS.get("uk", cutoff)
     return monthly_val >= cutoff
 
+def meets_cutoff(job: JobPost) -> bool:
+    # (salary, location) pairs repeat a lot across boards, so the decision is memoized
+    return _salary_meets_cutoff(job.salary or "", job.norm()["location"])
+
+# All resume keywords as one alternation, anchored on the left only: a keyword must start a word
+# ("across" no longer matches "ros") but may be followed by anything (ros2, python3, lidars, esp32s3)
+_RE_RESUME = re.compile(r"(?<![a-z0-9])(?:%s)"
+                        % "|".join(re.escape(kw) for kw in dict.fromkeys(k.lower() for k in RESUME_KEYWORDS)))
+
+@functools.lru_cache(maxsize=4096)
+def _text_matches_resume(text: str) -> bool:
+    return _RE_RESUME.search(text) is not None
+
 def matches_resume(job: JobPost) -> bool:
-    text = " ".join([job.role or "", job.company or "", job.description_snippet or ""]).lower()
-    for kw in RESUME_KEYWORDS:
-        if kw.lower() in text:
-            return True
-    return False
+    n = job.norm()
+    # cheap tier first: role titles are short and repeat across boards, so this is mostly a cache hit;
+    # the full text (role + company + snippet) is only scanned when the title alone doesn't match
+    return _text_matches_resume(n["role"]) or _text_matches_resume(n["text"])
+
+# Sites whose job identity is known: only these query keys identify the posting (LinkedIn and
+# Naukri carry the job id in the path; their query is per-result position/search-session noise)
+IDENTIFYING_PARAMS = {
+    "indeed.com": {"jk", "vjk"},
+    "linkedin.com": set(),
+    "naukri.com": set(),
+}
+# Elsewhere, query keys that only track the click/referrer/result position are dropped
+TRACKING_PARAMS = {"refid", "trackingid", "trk", "fccid", "from", "tk", "vjs", "currentjobid", "src", "ref",
+                   "position", "pagenum", "sid", "xp", "px"}
 
-def dedupe_jobs(jobs: List[JobPost]) -> List[JobPost]:
-    seen: Set[Tuple[str,str,str,str]] = set()
+def _keep_query_param(host: str, key: str) -> bool:
+    for site, keys in IDENTIFYING_PARAMS.items():
+        if host == site or host.endswith("." + site):
+            return key in keys
+    return not key.startswith("utm_") and key not in TRACKING_PARAMS
+
+def canonicalize_link(link: Optional[str]) -> str:
+    """
+    Link identity for dedupe: lower-case scheme/host, non-identifying query params
+    (IDENTIFYING_PARAMS / TRACKING_PARAMS / utm_*), fragment and trailing slash removed.
+
+    >>> canonicalize_link("https://www.indeed.com/rc/clk?jk=aaa") == canonicalize_link("https://www.indeed.com/rc/clk?jk=bbb")
+    False
+    >>> canonicalize_link("https://WWW.linkedin.com/jobs/view/42/?refId=x&position=3&pageNum=0&utm_source=z")
+    'https://www.linkedin.com/jobs/view/42'
+    >>> canonicalize_link("https://www.naukri.com/job-listings-ml-engineer-123?src=jobsearchDesk&sid=9&xp=1&px=1")
+    'https://www.naukri.com/job-listings-ml-engineer-123'
+    """
+    if not link:
+        return ""
+    parts = urlsplit(link.strip())
+    host = parts.netloc.lower()
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                       if _keep_query_param(host, k.lower())])
+    return urlunsplit((parts.scheme.lower(), host, parts.path.rstrip("/"), query, ""))
+
+def dedupe_jobs(jobs: List[JobPost], seen: Optional[Set[str]] = None) -> List[JobPost]:
+    seen = set() if seen is None else seen
     out: List[JobPost] = []
     for j in jobs:
         key = j.dedupe_key()
@@ -193,22 +298,58 @@ def dedupe_jobs(jobs: List[JobPost]) -> List[JobPost]:
         out.append(j)
     return out
 
+def merge_jobs(*batches: List[JobPost]) -> List[JobPost]:
+    """
+    Merge job lists keyed by canonical link (dedupe_key when there is no link), keeping first-seen order.
+    On a collision the record with a parsed salary wins.
+    """
+    by_key: Dict[str, JobPost] = {}
+    for batch in batches:
+        for j in batch:
+            key = canonicalize_link(j.link) or j.dedupe_key()
+            kept = by_key.get(key)
+            if kept is None or (kept.salary == "N/A" and j.salary != "N/A"):
+                by_key[key] = j
+    return list(by_key.values())
+
+EXPORT_COLUMNS = ["company","role","location","remote","salary","link","source","status","description_snippet"]
+
 def export_jobs(jobs: List[JobPost], fname: str):
-    df = pd.DataFrame([asdict(j) for j in jobs])
-    order = ["company","role","location","remote","salary","link","source","status","description_snippet"]
-    cols = [c for c in order if c in df.columns]
-    df = df[cols]
-    df.to_excel(fname, index=False)
+    # build column arrays directly instead of one dict per job
+    df = pd.DataFrame({c: [getattr(j, c) for j in jobs] for c in EXPORT_COLUMNS}, copy=False)
+    if fname.endswith(".feather"):
+        df.to_feather(fname)
+    elif fname.endswith(".parquet"):
+        df.to_parquet(fname, index=False)
+    else:
+        # constant_memory streams rows to disk instead of building the workbook in memory
+        with pd.ExcelWriter(fname, engine="xlsxwriter", engine_kwargs={"options": {"constant_memory": True}}) as w:
+            df.to_excel(w, index=False)
     logging.info("Exported %d rows to %s", len(df), fname)
 
+# -------------- CONCURRENT FETCH --------------
+async def _fetch_all(urls: List[str], timeout: float) -> List:
+    async with aiohttp.ClientSession(headers=HEADERS, timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+        async def fetch(url):
+            async with session.get(url) as r:
+                return await r.read()
+        return await asyncio.gather(*(fetch(u) for u in urls), return_exceptions=True)
+
+def fetch_all(urls: List[str], timeout: float = 15) -> List:
+    """
+    Fetch several pages concurrently over one keep-alive pool.
+    Returns one entry per URL, in order: the raw page bytes, or the exception raised for it.
+    """
+    return asyncio.run(_fetch_all(urls, timeout))
+
 # -------------- SCRAPERS (requests-based / free) --------------
 def scrape_ycombinator() -> List[JobPost]:
     url = "https://www.ycombinator.com/jobs"
     logging.info("Scraping YCombinator (requests)...")
     jobs = []
     try:
-        r = requests.get(url, headers=HEADERS, timeout=15)
-        soup = BeautifulSoup(r.text, "html.parser")
+        r = SESSION.get(url, timeout=15)
+        soup = BeautifulSoup(r.content, "lxml")
         for a in soup.select("a[href*='/jobs/']"):
             try:
                 link = a.get("href")
@@ -231,8 +372,8 @@ def scrape_startup_jobs() -> List[JobPost]:
     logging.info("Scraping Startup.jobs (requests)...")
     jobs = []
     try:
-        r = requests.get(url, headers=HEADERS, timeout=15)
-        soup = BeautifulSoup(r.text, "html.parser")
+        r = SESSION.get(url, timeout=15)
+        soup = BeautifulSoup(r.content, "lxml")
         for li in soup.select("li.job-listing, li.job"):
             try:
                 a = li.find("a")
@@ -255,8 +396,8 @@ def scrape_wellfound(query: str="machine learning", location: str="India") -> Li
     base = "https://wellfound.com"
     url = f"https://wellfound.com/jobs?search%5Bquery%5D={quote_plus(query)}&search%5Blocations%5D={quote_plus(location)}"
     try:
-        r = requests.get(url, headers=HEADERS, timeout=15)
-        soup = BeautifulSoup(r.text, "html.parser")
+        r = SESSION.get(url, timeout=15)
+        soup = BeautifulSoup(r.content, "lxml")
         for card in soup.select("a[data-test='job-serp__job-card']"):
             try:
                 link = card.get("href")
@@ -277,15 +418,18 @@ def scrape_wellfound(query: str="machine learning", location: str="India") -> Li
     return jobs
 
 def scrape_indeed(query: str="machine learning", location: str="India", pages: int=1) -> List[JobPost]:
-    logging.info("Scraping Indeed (requests, best-effort)...")
+    logging.info("Scraping Indeed (aiohttp, best-effort)...")
     jobs = []
     base = "https://www.indeed.com"
-    for p in range(pages):
-        start = p * 10
-        url = f"https://www.indeed.com/jobs?q={quote_plus(query)}&l={quote_plus(location)}&start={start}"
+    urls = [f"https://www.indeed.com/jobs?q={quote_plus(query)}&l={quote_plus(location)}&start={p * 10}"
+            for p in range(pages)]
+    # fetch all result pages at once; parsing stays sequential
+    for page in fetch_all(urls, timeout=15):
+        if isinstance(page, Exception):
+            logging.warning("Indeed failed: %s", page)
+            continue
         try:
-            r = requests.get(url, headers=HEADERS, timeout=15)
-            soup = BeautifulSoup(r.text, "html.parser")
+            soup = BeautifulSoup(page, "lxml")
             cards = soup.select("a.tapItem, div.jobsearch-SerpJobCard")
             for c in cards:
                 try:
@@ -303,27 +447,24 @@ def scrape_indeed(query: str="machine learning", location: str="India", pages: i
                     continue
         except Exception as e:
             logging.warning("Indeed failed: %s", e)
-        sleep_jitter(0.6,1.2)
+    sleep_jitter(0.6,1.2)
     return jobs
 
 # Remote-first sites
 def scrape_remoteok() -> List[JobPost]:
-    url = "https://remoteok.com/remote-dev-jobs"
-    logging.info("Scraping RemoteOK (requests)...")
+    # RemoteOK publishes its board as JSON (first element is a legal notice), salary included
+    url = "https://remoteok.com/api"
+    logging.info("Scraping RemoteOK (api)...")
     jobs = []
     try:
-        r = requests.get(url, headers=HEADERS, timeout=15)
-        soup = BeautifulSoup(r.text, "html.parser")
-        for row in soup.select("tr.job"):
-            try:
-                role = row.get("data-search") or row.get("data-position") or row.get("data-title") or row.get_text(" ",strip=True)
-                link = row.get("data-url")
-                if link and not link.startswith("http"):
-                    link = "https://remoteok.com" + link
-                company = row.get("data-company") or "RemoteOK"
-                jobs.append(JobPost(company=company, role=role, location="Remote", link=link, source="RemoteOK", description_snippet=role))
-            except Exception:
-                continue
+        data = SESSION.get(url, timeout=15).json()[1:]
+        jobs = [JobPost(company=d.get("company") or "RemoteOK", role=d.get("position", ""),
+                        location=d.get("location") or "Remote", link=d.get("url") or d.get("apply_url"),
+                        source="RemoteOK",
+                        # the API's salary_min/salary_max are annual USD figures
+                        salary=f"${d.get('salary_min')}-{d.get('salary_max')} per year" if d.get("salary_min") else "N/A",
+                        description_snippet=(d.get("description") or "")[:200])
+                for d in data if isinstance(d, dict)]
     except Exception as e:
         logging.warning("RemoteOK failed: %s", e)
     sleep_jitter()
@@ -334,8 +475,8 @@ def scrape_weworkremotely() -> List[JobPost]:
     logging.info("Scraping WeWorkRemotely (requests)...")
     jobs = []
     try:
-        r = requests.get(url, headers=HEADERS, timeout=15)
-        soup = BeautifulSoup(r.text, "html.parser")
+        r = SESSION.get(url, timeout=15)
+        soup = BeautifulSoup(r.content, "lxml")
         for li in soup.select("li.feature, li > .job"):
             try:
                 a = li.find("a", href=True)
@@ -354,21 +495,18 @@ def scrape_weworkremotely() -> List[JobPost]:
     return jobs
 
 def scrape_remotive() -> List[JobPost]:
-    url = "https://remotive.com/remote-jobs/software-dev"
-    logging.info("Scraping Remotive (requests)...")
+    url = "https://remotive.com/api/remote-jobs"
+    logging.info("Scraping Remotive (api)...")
     jobs = []
     try:
-        r = requests.get(url, headers=HEADERS, timeout=15)
-        soup = BeautifulSoup(r.text, "html.parser")
-        for div in soup.select("div.job-tile, div.job"):
-            try:
-                role = (div.select_one(".job-title") or div.select_one(".job-title a") or div).get_text(" ", strip=True)
-                company = div.select_one(".company-name") and div.select_one(".company-name").get_text(strip=True) or "Remotive"
-                link_tag = div.find("a", href=True)
-                link = link_tag["href"] if link_tag else url
-                jobs.append(JobPost(company=company, role=role, location="Remote", link=link, source="Remotive", description_snippet=role))
-            except Exception:
-                continue
+        data = SESSION.get(url, params={"category": "software-dev"}, timeout=15).json().get("jobs", [])
+        jobs = [JobPost(company=d.get("company_name") or "Remotive", role=d.get("title", ""),
+                        location=d.get("candidate_required_location") or "Remote", link=d.get("url"),
+                        # Remotive's salary is free text ("$80k - $120k", "$40 - $60 per hour") that
+                        # extract_salary_numbers misreads, so it is not used for the cutoff
+                        source="Remotive",
+                        description_snippet=(d.get("description") or "")[:200])
+                for d in data if isinstance(d, dict)]
     except Exception as e:
         logging.warning("Remotive failed: %s", e)
     sleep_jitter()
@@ -382,32 +520,63 @@ BIG_TECH_SITES = {
     "meta": "https://www.metacareers.com/jobs"
 }
 
+# Link filters for career pages (case-insensitive, so no .lower() copies per link)
+_BIGTECH_HREF_RE = re.compile(r"/jobs?/|/position/|/careers|job-openings", re.I)
+_BIGTECH_TXT_RE = re.compile(r"engineer|machine|research|software", re.I)
+
 def scrape_bigtech_generic() -> List[JobPost]:
-    logging.info("Scraping BigTech careers (requests, heuristics)...")
+    logging.info("Scraping BigTech careers (aiohttp, heuristics)...")
     jobs = []
-    for name, url in BIG_TECH_SITES.items():
+    sites = list(BIG_TECH_SITES.items())
+    pages = fetch_all([url for _, url in sites], timeout=12)
+    for (name, url), page in zip(sites, pages):
+        if isinstance(page, Exception):
+            logging.warning("BigTech fetch failed for %s: %s", name, page)
+            continue
         try:
-            r = requests.get(url, headers=HEADERS, timeout=12)
-            soup = BeautifulSoup(r.text, "html.parser")
+            soup = BeautifulSoup(page, "lxml")
             for a in soup.find_all("a", href=True):
                 txt = a.get_text(" ", strip=True)
                 href = a["href"]
                 if not txt: continue
-                if any(k in href.lower() for k in ["/job/", "/jobs/", "/position/", "/careers", "job-openings"]) or any(k in txt.lower() for k in ["engineer","machine","research","software"]):
+                if _BIGTECH_HREF_RE.search(href) or _BIGTECH_TXT_RE.search(txt):
                     link = href if href.startswith("http") else urljoin(url, href)
                     role = txt[:150]
                     jobs.append(JobPost(company=name.capitalize(), role=role, location="N/A", link=link, source=f"{name}-careers", description_snippet=role))
         except Exception as e:
-            logging.warning("BigTech fetch failed for %s: %s", name, e)
-        sleep_jitter(0.2,0.6)
+            logging.warning("BigTech parse failed for %s: %s", name, e)
+    sleep_jitter(0.2,0.6)
     return jobs
 
 # -------------- SELENIUM DRIVER & LOGIN / COOKIES --------------
-def make_selenium_driver(headless: bool = True):
+# Chrome content settings: 2 = block. Text scraping and form filling don't need these assets
+LIGHT_PAGE_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.stylesheets": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+}
+
+def make_selenium_driver(headless: bool = True, light: bool = True, profile_dir: Optional[str] = None):
+    """
+    Start Chrome. `light` blocks images/CSS/fonts; pass False for flows that need fully rendered pages.
+    Pages are treated as loaded at DOMContentLoaded ("eager"); callers wait for the elements they need.
+    `profile_dir` keeps cache/cookies between runs; a profile can only be open in one Chrome at a time.
+    """
     opts = Options()
+    if profile_dir:
+        opts.add_argument(f"--user-data-dir={profile_dir}")
+        opts.add_argument("--profile-directory=Default")
     if headless:
         # modern headless
         opts.add_argument("--headless=new")
+    opts.page_load_strategy = "eager"
+    if light:
+        opts.add_experimental_option("prefs", LIGHT_PAGE_PREFS)
+        # also stops Blink from decoding images the content setting lets through (e.g. CSS/inline)
+        opts.add_argument("--blink-settings=imagesEnabled=false")
+    else:
+        # prefs are persisted into a reused profile, so explicitly re-allow what a light run blocked
+        opts.add_experimental_option("prefs", {k: 1 for k in LIGHT_PAGE_PREFS})
     opts.add_argument("--no-sandbox")
     opts.add_argument("--disable-dev-shm-usage")
     opts.add_argument("--window-size=1920,1080")
@@ -418,28 +587,120 @@ def make_selenium_driver(headless: bool = True):
     driver.set_page_load_timeout(30)
     return driver
 
+# The apply worker's Chrome (one per worker process, see _init_apply_worker); bootstrap is paid once
+_DRIVER = None
+
+def quit_selenium_driver():
+    global _DRIVER
+    if _DRIVER is not None:
+        try:
+            _DRIVER.quit()
+        except Exception:
+            pass
+        _DRIVER = None
+
+# Probe several selectors in a single WebDriver round-trip instead of one failing find_element each
+def find_first(driver, css: Optional[str] = None, xpath: Optional[str] = None):
+    """
+    Return the first element matching a CSS selector list or an XPath (evaluated in-page), or None.
+    """
+    if css:
+        return driver.execute_script("return document.querySelector(arguments[0]);", css)
+    return driver.execute_script(
+        "return document.evaluate(arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;",
+        xpath)
+
+# Max seconds to wait for an element/navigation; waits return as soon as the condition holds
+WAIT_TIMEOUT = 8
+# Search result pages are heavier, so give their first card a bit longer
+SCAN_WAIT_TIMEOUT = 10
+
+def wait_for_first(driver, css: Optional[str] = None, xpath: Optional[str] = None, timeout: float = WAIT_TIMEOUT):
+    """
+    Poll find_first until it matches; return the element, or None after `timeout` seconds.
+    """
+    try:
+        return WebDriverWait(driver, timeout).until(lambda d: find_first(d, css=css, xpath=xpath))
+    except TimeoutException:
+        return None
+
+def wait_until(driver, condition, timeout: float = WAIT_TIMEOUT) -> bool:
+    try:
+        WebDriverWait(driver, timeout).until(condition)
+        return True
+    except TimeoutException:
+        return False
+
+def wait_clickable(driver, xpath: str, timeout: float = WAIT_TIMEOUT):
+    """
+    Wait for the first element matching `xpath` to be visible and enabled; return it, or None after `timeout`.
+    """
+    try:
+        return WebDriverWait(driver, timeout).until(EC.element_to_be_clickable((By.XPATH, xpath)))
+    except TimeoutException:
+        return None
+
+def click_and_wait(driver, element, timeout: float = WAIT_TIMEOUT) -> bool:
+    """
+    Click `element` and wait until it is detached (modal closed / next step rendered) or the page navigates.
+    """
+    url = driver.current_url
+    element.click()
+    return wait_until(driver, lambda d: EC.staleness_of(element)(d) or d.current_url != url, timeout)
+
+# Pages that need a logged-in session; landing back on a login page means saved cookies are stale
+SITE_HOME_URLS = {
+    "linkedin": "https://www.linkedin.com/feed/",
+    "naukri": "https://www.naukri.com/mnjuser/homepage",
+    "wellfound": "https://wellfound.com/jobs",
+}
+
+def _to_cdp_cookie(c: Dict) -> Dict:
+    cookie = {k: c[k] for k in ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite") if k in c}
+    if "expiry" in c:
+        cookie["expires"] = c["expiry"]
+    return cookie
+
+# Cookie files younger than this whose cookies are not about to expire are trusted without a probe (seconds)
+COOKIE_TTL = int(os.getenv("COOKIE_TTL", str(12 * 3600)))
+
+def _cookies_fresh(cookie_file: str, cookies: List[Dict]) -> bool:
+    if not cookies or time.time() - os.path.getmtime(cookie_file) >= COOKIE_TTL:
+        return False
+    # session cookies (no expiry) ride on the file age; the rest must outlive this run by 5 min
+    horizon = time.time() + 300
+    return all(c["expiry"] > horizon for c in cookies if "expiry" in c)
+
+def _on_login_page(driver) -> bool:
+    url = driver.current_url.lower()
+    return any(k in url for k in ("login", "signin", "authwall"))
+
 def load_or_login_save_cookies(site: str, login_url: str, login_flow_callable, driver):
     # cookie file
     cookie_file = f"{site}_cookies.pkl"
     if os.path.exists(cookie_file):
         try:
-            driver.get(login_url)
-            cookies = pickle.load(open(cookie_file, "rb"))
-            for c in cookies:
-                try:
-                    driver.add_cookie(c)
-                except Exception:
-                    continue
-            driver.get(login_url)
-            logging.info("Loaded cookies for %s", site)
-            return True
+            with open(cookie_file, "rb") as f:
+                cookies = pickle.load(f)
+            # one CDP call sets every cookie; no need to open the site first as add_cookie requires
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": [_to_cdp_cookie(c) for c in cookies]})
+            if _cookies_fresh(cookie_file, cookies):
+                logging.info("Loaded fresh cookies for %s", site)
+                return True
+            # session-still-valid probe before trusting older cookies
+            driver.get(SITE_HOME_URLS.get(site, login_url))
+            if not _on_login_page(driver):
+                logging.info("Loaded cookies for %s", site)
+                return True
+            logging.info("Saved session for %s expired; logging in again", site)
         except Exception:
             logging.warning("Failed to load cookies for %s", site)
     # perform login flow callback that handles login via driver and returns True on success
     ok = login_flow_callable(driver)
     if ok:
         try:
-            pickle.dump(driver.get_cookies(), open(cookie_file, "wb"))
+            with open(cookie_file, "wb") as f:
+                pickle.dump(driver.get_cookies(), f)
             logging.info("Saved cookies for %s", site)
         except Exception:
             logging.warning("Could not save cookies for %s", site)
@@ -453,11 +714,11 @@ def linkedin_login_flow(driver) -> bool:
         return False
     try:
         driver.get("https://www.linkedin.com/login")
-        time.sleep(2)
+        wait_for_first(driver, css="#username")
         driver.find_element(By.ID, "username").clear(); driver.find_element(By.ID, "username").send_keys(email)
         driver.find_element(By.ID, "password").clear(); driver.find_element(By.ID, "password").send_keys(pwd)
         driver.find_element(By.ID, "password").send_keys(Keys.RETURN)
-        time.sleep(3)
+        wait_until(driver, EC.url_contains("feed"))
         # simple check
         if "feed" in driver.current_url or "linkedin.com" in driver.current_url:
             logging.info("LinkedIn login likely succeeded.")
@@ -472,8 +733,9 @@ def naukri_login_flow(driver) -> bool:
         logging.info("Naukri credentials not provided.")
         return False
     try:
-        driver.get("https://www.naukri.com/nlogin/login")
-        time.sleep(2)
+        login_url = "https://www.naukri.com/nlogin/login"
+        driver.get(login_url)
+        wait_for_first(driver, css="#usernameField, input[name='email']")
         # Naukri has multiple login flows - try email login
         try:
             driver.find_element(By.ID, "usernameField").send_keys(email)
@@ -484,7 +746,7 @@ def naukri_login_flow(driver) -> bool:
             driver.find_element(By.NAME, "email").send_keys(email)
             driver.find_element(By.NAME, "password").send_keys(pwd)
             driver.find_element(By.XPATH, "//button[contains(.,'Login')]").click()
-        time.sleep(4)
+        wait_until(driver, EC.url_changes(login_url))
         # no reliable URL check; assume success if no errors shown
         logging.info("Attempted Naukri login.")
         return True
@@ -498,8 +760,9 @@ def wellfound_login_flow(driver) -> bool:
         logging.info("Wellfound credentials not provided.")
         return False
     try:
-        driver.get("https://wellfound.com/signin")
-        time.sleep(2)
+        login_url = "https://wellfound.com/signin"
+        driver.get(login_url)
+        wait_for_first(driver, css="#email")
         # try to find email/password
         try:
             driver.find_element(By.ID, "email").send_keys(email)
@@ -508,7 +771,7 @@ def wellfound_login_flow(driver) -> bool:
         except Exception:
             logging.warning("Wellfound login selectors failed; please login manually once and cookies will be saved.")
             return False
-        time.sleep(3)
+        wait_until(driver, EC.url_changes(login_url))
         logging.info("Attempted Wellfound login.")
         return True
     except Exception as e:
@@ -520,41 +783,38 @@ def wellfound_login_flow(driver) -> bool:
 def linkedin_easy_apply(driver, job: JobPost) -> None:
     try:
         driver.get(job.link)
-        time.sleep(3)
-        # LinkedIn uses a variety of apply buttons; try common selectors
-        try:
-            apply_button = driver.find_element(By.CSS_SELECTOR, "button.jobs-apply-button")
-        except:
-            try:
-                apply_button = driver.find_element(By.CSS_SELECTOR, "button[data-control-name='apply_unify']")
-            except:
-                apply_button = None
+        # LinkedIn uses a variety of apply buttons; wait for any of the common selectors
+        apply_button = wait_for_first(driver, css="button.jobs-apply-button, button[data-control-name='apply_unify']")
         if not apply_button:
             job.status = "Pending"
             return
         apply_button.click()
-        time.sleep(2)
+        # wait for the apply modal (file input or submit button) instead of a fixed pause
+        wait_for_first(driver, xpath="//input[@type='file'] | //button[contains(.,'Submit') or contains(.,'Apply') or contains(.,'Send application')]")
         # attempt to attach resume
         try:
             # find file input
-            file_input = driver.find_element(By.XPATH, "//input[@type='file']")
-            if RESUME_PATH and os.path.exists(RESUME_PATH):
+            file_input = find_first(driver, xpath="//input[@type='file']")
+            if file_input and RESUME_PATH and os.path.exists(RESUME_PATH):
                 file_input.send_keys(os.path.abspath(RESUME_PATH))
-                time.sleep(1)
         except Exception:
             # some flows don't expose file inputs; continue
             pass
         # try fill phone
         try:
-            tel = driver.find_element(By.XPATH, "//input[@type='tel' or @name='phoneNumber' or contains(@id,'phone')]")
-            tel.clear(); tel.send_keys(PHONE)
+            tel = find_first(driver, xpath="//input[@type='tel' or @name='phoneNumber' or contains(@id,'phone')]")
+            if tel:
+                tel.clear(); tel.send_keys(PHONE)
         except Exception:
             pass
         # try submit (may be "Submit application" or "Next" requiring steps)
         try:
-            submit_btn = driver.find_element(By.XPATH, "//button[contains(.,'Submit') or contains(.,'Apply') or contains(.,'Send application')]")
-            submit_btn.click()
-            time.sleep(2)
+            # wait for the upload to settle: submit is usually disabled until then
+            submit_btn = wait_clickable(driver, "//button[contains(.,'Submit') or contains(.,'Apply') or contains(.,'Send application')]")
+            if not submit_btn:
+                job.status = "Flagged"
+                return
+            click_and_wait(driver, submit_btn)
             job.status = "Applied"
             logging.info("Applied via LinkedIn to %s - %s", job.company, job.role)
             return
@@ -570,25 +830,29 @@ def naukri_easy_apply(driver, job: JobPost) -> None:
     # Naukri's apply flows often open external pages; try simple apply if visible
     try:
         driver.get(job.link)
-        time.sleep(3)
         # look for "Apply" buttons or "Quick Apply"
         try:
-            apply_btn = driver.find_element(By.XPATH, "//button[contains(.,'Apply') or contains(.,'Apply Now') or contains(.,'Quick Apply')]")
+            apply_btn = wait_for_first(driver, xpath="//button[contains(.,'Apply') or contains(.,'Apply Now') or contains(.,'Quick Apply')]")
+            if not apply_btn:
+                job.status = "Pending"
+                return
             apply_btn.click()
-            time.sleep(2)
+            wait_for_first(driver, xpath="//input[@type='file'] | //button[contains(.,'Submit') or contains(.,'Apply Now')]")
             # try upload resume
             try:
-                file_input = driver.find_element(By.XPATH, "//input[@type='file']")
-                if RESUME_PATH and os.path.exists(RESUME_PATH):
+                file_input = find_first(driver, xpath="//input[@type='file']")
+                if file_input and RESUME_PATH and os.path.exists(RESUME_PATH):
                     file_input.send_keys(os.path.abspath(RESUME_PATH))
-                    time.sleep(1)
             except Exception:
                 pass
             # try final submit
             try:
-                submit = driver.find_element(By.XPATH, "//button[contains(.,'Submit') or contains(.,'Apply Now')]")
-                submit.click()
-                time.sleep(2)
+                # wait for the upload to settle: submit is usually disabled until then
+                submit = wait_clickable(driver, "//button[contains(.,'Submit') or contains(.,'Apply Now')]")
+                if not submit:
+                    job.status = "Flagged"
+                    return
+                click_and_wait(driver, submit)
                 job.status = "Applied"
                 logging.info("Applied via Naukri to %s - %s", job.company, job.role)
                 return
@@ -605,25 +869,29 @@ def naukri_easy_apply(driver, job: JobPost) -> None:
 def wellfound_easy_apply(driver, job: JobPost) -> None:
     try:
         driver.get(job.link)
-        time.sleep(3)
         # look for apply buttons
         try:
-            apply_btn = driver.find_element(By.XPATH, "//button[contains(.,'Apply') or contains(.,'Save')]")
+            apply_btn = wait_for_first(driver, xpath="//button[contains(.,'Apply') or contains(.,'Save')]")
+            if not apply_btn:
+                job.status = "Pending"
+                return
             apply_btn.click()
-            time.sleep(2)
+            wait_for_first(driver, xpath="//input[@type='file'] | //button[contains(.,'Submit') or contains(.,'Continue') or contains(.,'Send')]")
             # attempt file upload
             try:
-                file_input = driver.find_element(By.XPATH, "//input[@type='file']")
-                if RESUME_PATH and os.path.exists(RESUME_PATH):
+                file_input = find_first(driver, xpath="//input[@type='file']")
+                if file_input and RESUME_PATH and os.path.exists(RESUME_PATH):
                     file_input.send_keys(os.path.abspath(RESUME_PATH))
-                    time.sleep(1)
             except Exception:
                 pass
             # Try final submit
             try:
-                submit = driver.find_element(By.XPATH, "//button[contains(.,'Submit') or contains(.,'Continue') or contains(.,'Send')]")
-                submit.click()
-                time.sleep(2)
+                # wait for the upload to settle: submit is usually disabled until then
+                submit = wait_clickable(driver, "//button[contains(.,'Submit') or contains(.,'Continue') or contains(.,'Send')]")
+                if not submit:
+                    job.status = "Flagged"
+                    return
+                click_and_wait(driver, submit)
                 job.status = "Applied"
                 logging.info("Applied via Wellfound to %s - %s", job.company, job.role)
                 return
@@ -640,25 +908,29 @@ def wellfound_easy_apply(driver, job: JobPost) -> None:
 def indeed_try_apply(driver, job: JobPost) -> None:
     try:
         driver.get(job.link)
-        time.sleep(3)
         # Indeed sometimes has "Apply Now" or "Easily apply on Indeed"
         try:
-            btn = driver.find_element(By.XPATH, "//button[contains(.,'Apply') or contains(.,'Easily apply')]")
+            btn = wait_for_first(driver, xpath="//button[contains(.,'Apply') or contains(.,'Easily apply')]")
+            if not btn:
+                job.status = "Pending"
+                return
             btn.click()
-            time.sleep(2)
+            wait_for_first(driver, xpath="//input[@type='file'] | //button[contains(.,'Submit') or contains(.,'Apply')]")
             # attempt to upload resume
             try:
-                file_input = driver.find_element(By.XPATH, "//input[@type='file']")
-                if RESUME_PATH and os.path.exists(RESUME_PATH):
+                file_input = find_first(driver, xpath="//input[@type='file']")
+                if file_input and RESUME_PATH and os.path.exists(RESUME_PATH):
                     file_input.send_keys(os.path.abspath(RESUME_PATH))
-                    time.sleep(1)
             except Exception:
                 pass
             # attempt submit
             try:
-                submit = driver.find_element(By.XPATH, "//button[contains(.,'Submit') or contains(.,'Apply')]")
-                submit.click()
-                time.sleep(2)
+                # wait for the upload to settle: submit is usually disabled until then
+                submit = wait_clickable(driver, "//button[contains(.,'Submit') or contains(.,'Apply')]")
+                if not submit:
+                    job.status = "Flagged"
+                    return
+                click_and_wait(driver, submit)
                 job.status = "Applied"
                 logging.info("Applied via Indeed to %s - %s", job.company, job.role)
                 return
@@ -676,50 +948,271 @@ def indeed_try_apply(driver, job: JobPost) -> None:
 
 # -------------- ORCHESTRATOR --------------
 def run_scrapers(config: Dict) -> List[JobPost]:
-    all_jobs: List[JobPost] = []
+    query = config.get("query", "machine learning")
+    location = config.get("location", "India")
+    tasks = []
     if config.get("yc", True):
-        all_jobs.extend(scrape_ycombinator())
+        tasks.append((scrape_ycombinator, {}))
     if config.get("startup", True):
-        all_jobs.extend(scrape_startup_jobs())
+        tasks.append((scrape_startup_jobs, {}))
     if config.get("wellfound", True):
-        all_jobs.extend(scrape_wellfound(query=config.get("query", "machine learning"), location=config.get("location", "India")))
+        tasks.append((scrape_wellfound, {"query": query, "location": location}))
     if config.get("indeed", True):
-        all_jobs.extend(scrape_indeed(query=config.get("query", "machine learning"), location=config.get("location", "India"), pages=config.get("indeed_pages", 1)))
+        tasks.append((scrape_indeed, {"query": query, "location": location, "pages": config.get("indeed_pages", 1)}))
     if config.get("remoteok", True):
-        all_jobs.extend(scrape_remoteok())
+        tasks.append((scrape_remoteok, {}))
     if config.get("weworkremotely", True):
-        all_jobs.extend(scrape_weworkremotely())
+        tasks.append((scrape_weworkremotely, {}))
     if config.get("remotive", True):
-        all_jobs.extend(scrape_remotive())
+        tasks.append((scrape_remotive, {}))
     if config.get("bigtech", True):
-        all_jobs.extend(scrape_bigtech_generic())
+        tasks.append((scrape_bigtech_generic, {}))
+    # Scrapers are independent and network-bound: run them concurrently (SESSION pool >= workers)
+    all_jobs: List[JobPost] = []
+    if not tasks:
+        return all_jobs
+    seen: Set[str] = set()
+    with ThreadPoolExecutor(max_workers=len(tasks)) as ex:
+        futures = [(fn.__name__, ex.submit(fn, **kw)) for fn, kw in tasks]
+        # collect in submission order so the job list (and the apply cap) stays deterministic;
+        # duplicates across scrapers are dropped as they arrive
+        for name, fut in futures:
+            try:
+                all_jobs.extend(dedupe_jobs(fut.result() or [], seen))
+            except Exception as e:
+                logging.warning("%s failed: %s", name, e)
     # Selenium scrapers for Naukri/LinkedIn/Glassdoor will be handled via selenium flows below to also allow auto-apply
     return all_jobs
 
-def run_selenium_scans_and_apply(driver, jobs: List[JobPost], config: Dict):
+def apply_job(driver, job: JobPost) -> None:
     # We'll try to auto-apply for jobs on LinkedIn / Naukri / Wellfound / Indeed if link domain matches.
-    for job in tqdm(jobs, desc="Applying / Flagging jobs"):
+    try:
+        link = job.link.lower()
+        # Choose site-specific apply if link indicates the site
+        if "linkedin.com" in link:
+            linkedin_easy_apply(driver, job)
+        elif "naukri.com" in link:
+            naukri_easy_apply(driver, job)
+        elif "wellfound.com" in link or "angel.co" in link:
+            wellfound_easy_apply(driver, job)
+        elif "indeed.com" in link:
+            indeed_try_apply(driver, job)
+        else:
+            # For remote sites and bigtech careers often external or complex forms; mark as Pending
+            job.status = "Pending"
+    except Exception as e:
+        logging.warning("Auto-apply loop error for %s: %s", job.link, e)
+        if job.status != "Applied":
+            job.status = "Flagged"
+
+LOGIN_SITES = [
+    ("linkedin", "https://www.linkedin.com/login", linkedin_login_flow),
+    ("naukri", "https://www.naukri.com/nlogin/login", naukri_login_flow),
+    ("wellfound", "https://wellfound.com/signin", wellfound_login_flow),
+]
+
+# Serializes cookie-file reads/writes when several drivers log in at once
+# (a process lock: apply workers are separate processes, see run_parallel_apply)
+_COOKIE_LOCK = multiprocessing.Lock()
+
+def login_all(driver) -> None:
+    for site, login_url, flow in LOGIN_SITES:
         try:
-            link = job.link.lower()
-            # Choose site-specific apply if link indicates the site
-            if "linkedin.com" in link:
-                linkedin_easy_apply(driver, job)
-            elif "naukri.com" in link:
-                naukri_easy_apply(driver, job)
-            elif "wellfound.com" in link or "angel.co" in link:
-                wellfound_easy_apply(driver, job)
-            elif "indeed.com" in link:
-                indeed_try_apply(driver, job)
-            else:
-                # For remote sites and bigtech careers often external or complex forms; mark as Pending
-                job.status = "Pending"
+            with _COOKIE_LOCK:
+                load_or_login_save_cookies(site, login_url, flow, driver)
+        except Exception:
+            pass
+
+def _init_apply_worker(cookie_lock, profile_slots) -> None:
+    # each worker process owns one logged-in Chrome for its whole life
+    global _DRIVER, _COOKIE_LOCK
+    _COOKIE_LOCK = cookie_lock
+    # workers claim distinct slots so no two Chromes share a profile, and slot n is reused run to run;
+    # a replacement worker (after a crash) finds no free slot and uses a throwaway profile
+    try:
+        profile_dir = f"{PROFILE_DIR}-{profile_slots.get(timeout=5)}" if PROFILE_DIR else None
+    except queue.Empty:
+        profile_dir = None
+    # a forked worker inherits the parent's driver handle; never reuse it.
+    # An initializer that raises makes Pool respawn the worker forever, so start-up errors are
+    # swallowed here and every job handed to this worker is flagged instead.
+    try:
+        _DRIVER = make_selenium_driver(headless=HEADLESS, light=not RENDER_APPLY_PAGES, profile_dir=profile_dir)
+    except Exception as e:
+        logging.warning("Could not start Chrome in apply worker: %s", e)
+        _DRIVER = None
+        return
+    # pool workers skip atexit, but run multiprocessing finalizers on a clean close()/join()
+    multiprocessing.util.Finalize(None, quit_selenium_driver, exitpriority=10)
+    login_all(_DRIVER)
+
+def _apply_in_worker(item: Tuple[int, JobPost]) -> Tuple[int, str]:
+    idx, job = item
+    if _DRIVER is None:
+        return idx, "Flagged"
+    apply_job(_DRIVER, job)
+    return idx, job.status
+
+def run_parallel_apply(jobs: List[JobPost], workers: int = APPLY_WORKERS,
+                       on_applied: Optional[Callable[[JobPost], None]] = None):
+    """
+    Apply to `jobs` across `workers` Chrome drivers, each in its own process with its own login.
+    Job statuses are updated in place.
+    """
+    if not jobs:
+        return
+    workers = max(1, min(workers, len(jobs)))
+    profile_slots = multiprocessing.Queue()
+    for n in range(1, workers + 1):
+        profile_slots.put(n)
+    pool = multiprocessing.Pool(workers, initializer=_init_apply_worker, initargs=(_COOKIE_LOCK, profile_slots))
+    try:
+        for idx, status in tqdm(pool.imap_unordered(_apply_in_worker, enumerate(jobs)),
+                                total=len(jobs), desc="Applying / Flagging jobs"):
+            jobs[idx].status = status
+            if on_applied and status == "Applied":
+                on_applied(jobs[idx])
+    except BaseException:
+        pool.terminate()
+        raise
+    finally:
+        # close() + join() (not terminate) so workers run their finalizer and quit Chrome
+        pool.close()
+        pool.join()
+
+# -------------- PLAYWRIGHT SCANS --------------
+# Read-only search pages are scanned with Playwright (auto-waiting, CDP transport);
+# Selenium is kept for the login/apply flows built on it.
+
+# Resource types not needed to read result cards (same idea as LIGHT_PAGE_PREFS)
+SCAN_BLOCKED_RESOURCES = {"image", "stylesheet", "font", "media"}
+
+# In-page extraction of the first `limit` search result cards: returns [{role, comp, loc, link[, salary]}] in one call
+LINKEDIN_CARDS_JS = """
+({sel, limit}) => {
+    const txt = (c, s) => (c.querySelector(s)?.innerText || '').trim();
+    return Array.from(document.querySelectorAll(sel)).slice(0, limit).map(c => ({
+        role: txt(c, 'a.job-card-list__title, a.base-card__full-link'),
+        comp: txt(c, '.job-card-container--company-name, a.job-card-container__company-name'),
+        loc: txt(c, '.job-card-container__metadata-item'),
+        link: c.querySelector('a')?.href || null,
+    }));
+}
+"""
+
+NAUKRI_CARDS_JS = """
+({sel, limit}) => {
+    const txt = (c, s) => (c.querySelector(s)?.innerText || '').trim();
+    return Array.from(document.querySelectorAll(sel)).slice(0, limit).map(c => ({
+        role: txt(c, 'a.title'),
+        comp: txt(c, '.companyInfo .subTitle'),
+        loc: txt(c, '.location'),
+        link: c.querySelector('a.title')?.href || null,
+        salary: txt(c, '.salary'),
+    }));
+}
+"""
+
+def _load_saved_cookies(context, sites) -> None:
+    # cookie files written by load_or_login_save_cookies; CDP cookie fields are what Playwright expects too
+    for site in sites:
+        cookie_file = f"{site}_cookies.pkl"
+        if not os.path.exists(cookie_file):
+            continue
+        try:
+            with open(cookie_file, "rb") as f:
+                context.add_cookies([_to_cdp_cookie(c) for c in pickle.load(f)])
+        except Exception:
+            logging.warning("Failed to load cookies for %s", site)
+
+def _scan_rows(page, url: str, card_css: str, js: str, limit: int) -> List[Dict]:
+    page.goto(url, wait_until="domcontentloaded")
+    try:
+        # resume as soon as the first card renders; no cards within the timeout means nothing to scan
+        page.wait_for_selector(card_css, state="attached", timeout=SCAN_WAIT_TIMEOUT * 1000)
+    except PlaywrightTimeoutError:
+        logging.info("No result cards at %s after %ss", url, SCAN_WAIT_TIMEOUT)
+        return []
+    # one round-trip for the whole result list; cards past `limit` never leave the page
+    return page.evaluate(js, {"sel": card_css, "limit": limit})
+
+def _scan_linkedin(page, config: Dict, seen_links: Set[str]) -> List[JobPost]:
+    logging.info("Playwright: scanning LinkedIn search results...")
+    search_url = f"https://www.linkedin.com/jobs/search/?keywords={quote_plus(config['query'])}&location={quote_plus(config['location'])}"
+    jobs = []
+    for r in _scan_rows(page, search_url, ".jobs-search-results__list-item, .base-card", LINKEDIN_CARDS_JS, 80):
+        key = canonicalize_link(r["link"])
+        if key and key in seen_links:
+            continue
+        seen_links.add(key)
+        if r["role"] and r["comp"]:
+            jobs.append(JobPost(company=r["comp"], role=r["role"], location=r["loc"], link=r["link"],
+                                source="LinkedIn", description_snippet=r["role"]))
+    return jobs
+
+def _scan_naukri(page, config: Dict, seen_links: Set[str]) -> List[JobPost]:
+    logging.info("Playwright: scanning Naukri search results...")
+    nurl = f"https://www.naukri.com/{quote_plus(config['query'])}-jobs-in-{quote_plus(config['location'])}"
+    jobs = []
+    for r in _scan_rows(page, nurl, ".jobTuple", NAUKRI_CARDS_JS, 200):
+        key = canonicalize_link(r["link"])
+        if key and key in seen_links:
+            continue
+        seen_links.add(key)
+        if r["role"]:
+            jobs.append(JobPost(company=r["comp"] or "Naukri", role=r["role"], location=r["loc"] or config['location'],
+                                link=r["link"], source="Naukri", salary=r["salary"] or "N/A",
+                                description_snippet=r["role"]))
+    return jobs
+
+SITE_SCANS = [("linkedin", "LinkedIn", _scan_linkedin), ("naukri", "Naukri", _scan_naukri)]
+
+def scan_site_results(config: Dict, enough: Callable[[], bool] = lambda: False) -> List[JobPost]:
+    """
+    Scan LinkedIn + Naukri search results (each gated by its config flag) in a headless Chromium,
+    reusing saved login cookies. The browser is only launched when a scan is still needed:
+    scans are skipped once `enough()` reports the job boards already gave plenty of candidates.
+    """
+    scan_jobs: List[JobPost] = []
+    scans = [s for s in SITE_SCANS if config.get(s[0], True)]
+    if not scans:
+        return scan_jobs
+    if enough():
+        logging.info("Enough candidates from job boards; skipping site scans")
+        return scan_jobs
+    # scan results repeat across pages/sections; drop them as they are collected
+    seen_links: Set[str] = set()
+    with sync_playwright() as p:
+        try:
+            browser = p.chromium.launch(headless=HEADLESS)
         except Exception as e:
-            logging.warning("Auto-apply loop error for %s: %s", job.link, e)
-            if job.status != "Applied":
-                job.status = "Flagged"
+            # e.g. browsers not installed (`playwright install chromium`); keep the board results
+            logging.warning("Could not launch Chromium for site scans: %s", e)
+            return scan_jobs
+        try:
+            context = browser.new_context(user_agent=random.choice(USER_AGENTS))
+            context.route("**/*", lambda route: route.abort()
+                          if route.request.resource_type in SCAN_BLOCKED_RESOURCES else route.continue_())
+            _load_saved_cookies(context, [site for site, _, _ in scans])
+            page = context.new_page()
+            for i, (site, name, scan) in enumerate(scans):
+                if i and enough():
+                    logging.info("Enough candidates from job boards; skipping remaining site scans")
+                    break
+                try:
+                    scan_jobs.extend(scan(page, config, seen_links))
+                except Exception as e:
+                    logging.warning("%s scan failed: %s", name, e)
+        finally:
+            browser.close()
+    return scan_jobs
 
 # -------------- MAIN FLOW --------------
-def main():
+def main(on_applied: Optional[Callable[[JobPost], None]] = None):
+    """
+    Run the full pipeline. `on_applied` is called with each job as soon as it is applied
+    (main.py uses it to start contact discovery early).
+    """
     MAX_APPS_PER_RUN = 20   # configurable limit
 
     config = {
@@ -733,96 +1226,47 @@ def main():
         "weworkremotely": True,
         "remotive": True,
         "bigtech": True,
+        "linkedin": True,   # browser scans (skipped when the boards already give enough candidates)
+        "naukri": True,
         "naukri_pages": 1,
         "indeed_pages": 1
     }
 
     logging.info("Starting scrapers...")
-    all_jobs = run_scrapers(config)
-    logging.info("Scraped %d jobs (before selenium site scans)", len(all_jobs))
+    # HTTP scrapers run in the background while this thread drives the browser scans (kept out of the pool)
+    scraper_pool = ThreadPoolExecutor(max_workers=1)
+    http_jobs = scraper_pool.submit(run_scrapers, config)
+    scraper_pool.shutdown(wait=False)
 
-    # Selenium: scrape LinkedIn + Naukri (with login & cookies)
-    driver = make_selenium_driver(headless=HEADLESS)
-    try:
-        # Attempt to login/save cookies
-        try:
-            load_or_login_save_cookies("linkedin", "https://www.linkedin.com/login", linkedin_login_flow, driver)
-        except Exception:
-            pass
-        try:
-            load_or_login_save_cookies("naukri", "https://www.naukri.com/nlogin/login", naukri_login_flow, driver)
-        except Exception:
-            pass
-        try:
-            load_or_login_save_cookies("wellfound", "https://wellfound.com/signin", wellfound_login_flow, driver)
-        except Exception:
-            pass
-
-        # LinkedIn search results
-        try:
-            logging.info("Selenium: scanning LinkedIn search results...")
-            search_url = f"https://www.linkedin.com/jobs/search/?keywords={quote_plus(config['query'])}&location={quote_plus(config['location'])}"
-            driver.get(search_url)
-            time.sleep(3)
-            cards = driver.find_elements(By.CSS_SELECTOR, ".jobs-search-results__list-item, .base-card")
-            for c in cards[:80]:
-                try:
-                    role = c.find_element(By.CSS_SELECTOR, "a.job-card-list__title, a.base-card__full-link").text.strip()
-                    comp = c.find_element(By.CSS_SELECTOR, ".job-card-container--company-name, a.job-card-container__company-name").text.strip()
-                    loc = c.find_element(By.CSS_SELECTOR, ".job-card-container__metadata-item").text.strip()
-                    link = c.find_element(By.CSS_SELECTOR, "a").get_attribute("href")
-                    job = JobPost(company=comp, role=role, location=loc, link=link, source="LinkedIn", description_snippet=role)
-                    all_jobs.append(job)
-                except Exception:
-                    continue
-        except Exception as e:
-            logging.warning("LinkedIn selenium scan failed: %s", e)
+    # Playwright: scan LinkedIn + Naukri (with saved login cookies), unless the boards have
+    # already returned well over a run's worth of resume matches by the time a scan would start
+    def enough() -> bool:
+        return http_jobs.done() and not http_jobs.exception() and \
+            sum(1 for j in http_jobs.result() if matches_resume(j)) > MAX_APPS_PER_RUN * 3
+    scan_jobs = scan_site_results(config, enough)
 
-        # Naukri search results
-        try:
-            logging.info("Selenium: scanning Naukri search results...")
-            nurl = f"https://www.naukri.com/{quote_plus(config['query'])}-jobs-in-{quote_plus(config['location'])}"
-            driver.get(nurl)
-            time.sleep(3)
-            cards = driver.find_elements(By.CSS_SELECTOR, ".jobTuple")
-            for c in cards[:200]:
-                try:
-                    title_el = c.find_element(By.CSS_SELECTOR, "a.title")
-                    role = title_el.text.strip()
-                    link = title_el.get_attribute("href")
-                    comp = c.find_element(By.CSS_SELECTOR, ".companyInfo .subTitle").text.strip() if c.find_elements(By.CSS_SELECTOR, ".companyInfo .subTitle") else "Naukri"
-                    loc = c.find_element(By.CSS_SELECTOR, ".location").text.strip() if c.find_elements(By.CSS_SELECTOR, ".location") else config['location']
-                    salary = c.find_element(By.CSS_SELECTOR, ".salary").text.strip() if c.find_elements(By.CSS_SELECTOR, ".salary") else "N/A"
-                    job = JobPost(company=comp, role=role, location=loc, link=link, source="Naukri", salary=salary, description_snippet=role)
-                    all_jobs.append(job)
-                except Exception:
-                    continue
-        except Exception as e:
-            logging.warning("Naukri selenium scan failed: %s", e)
-
-    finally:
-        # keep driver alive for later
-        pass
-
-    logging.info("Total jobs collected before dedupe: %d", len(all_jobs))
-    all_jobs = dedupe_jobs(all_jobs)
+    board_jobs = http_jobs.result()
+    logging.info("Scraped %d jobs from job boards, %d from site scans", len(board_jobs), len(scan_jobs))
+    all_jobs = merge_jobs(board_jobs, scan_jobs)
     logging.info("After dedupe: %d", len(all_jobs))
 
     # Filter jobs to only those matching your resume
     relevant_jobs = [j for j in all_jobs if matches_resume(j)]
 
-    # Export only relevant jobs
-    export_jobs(relevant_jobs, "jobs_raw.xlsx")
+    # Export only relevant jobs (machine-readable dump; xlsx is kept for the human-facing status sheet)
+    export_jobs(relevant_jobs, "jobs_raw.parquet")
 
     # Further filter shortlist with salary cutoff
     shortlisted = []
     for j in relevant_jobs:
+        # cutoff reads the salary + cached normalized location, so rejected jobs skip the clean-up below
+        if not meets_cutoff(j):
+            continue
         j.role = normalize_text(j.role)
         j.company = normalize_text(j.company)
         j.location = normalize_text(j.location)
         j.description_snippet = normalize_text(j.description_snippet)
-        if meets_cutoff(j):
-            shortlisted.append(j)
+        shortlisted.append(j)
     logging.info("Shortlisted after filtering: %d", len(shortlisted))
 
     # Cap number of applications
@@ -832,29 +1276,12 @@ def main():
         j.status = "Pending"   # mark rest as pending for manual apply
 
     # Run auto-apply for capped jobs
-    driver_apply = make_selenium_driver(headless=HEADLESS)
-    try:
-        # reload cookies
-        try:
-            load_or_login_save_cookies("linkedin", "https://www.linkedin.com/login", linkedin_login_flow, driver_apply)
-        except Exception:
-            pass
-        try:
-            load_or_login_save_cookies("naukri", "https://www.naukri.com/nlogin/login", naukri_login_flow, driver_apply)
-        except Exception:
-            pass
-        try:
-            load_or_login_save_cookies("wellfound", "https://wellfound.com/signin", wellfound_login_flow, driver_apply)
-        except Exception:
-            pass
-
-        run_selenium_scans_and_apply(driver_apply, to_apply, config)
-    finally:
-        driver_apply.quit()
+    run_parallel_apply(to_apply, APPLY_WORKERS, on_applied)
 
-    # final export with statuses
+    # final export with statuses (feather copy is the fast input for Contact.py)
     export_jobs(shortlisted, "jobs_with_status.xlsx")
-    logging.info("Done. Applied to %d jobs, capped at %d. Files: jobs_raw.xlsx, jobs_with_status.xlsx",
+    export_jobs(shortlisted, "jobs_with_status.feather")
+    logging.info("Done. Applied to %d jobs, capped at %d. Files: jobs_raw.parquet, jobs_with_status.xlsx",
                  len(to_apply), MAX_APPS_PER_RUN)
 
 
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+import Contact
+
+
+def make_provider(name, calls, emails=(), domain=None):
+    async def provider(session, company, ctx):
+        calls.append(name)
+        if domain is not None:
+            ctx["domain"] = domain
+        return emails
+    return provider
+
+
+def run_lookup(company="Acme"):
+    return asyncio.run(Contact.lookup(None, company))
+
+
+def test_lookup_returns_first_provider_with_emails(monkeypatch):
+    calls = []
+    monkeypatch.setattr(Contact, "PROVIDERS", [
+        make_provider("first", calls, ("a@acme.com", "b@acme.com")),
+        make_provider("second", calls, ("c@acme.com",)),
+    ])
+    assert run_lookup() == "a@acme.com, b@acme.com"
+    assert calls == ["first"]
+
+
+def test_lookup_falls_through_empty_and_failed_providers(monkeypatch):
+    calls = []
+    monkeypatch.setattr(Contact, "PROVIDERS", [
+        make_provider("empty", calls, ()),
+        make_provider("failed", calls, None),
+        make_provider("hit", calls, ("hr@acme.com",)),
+    ])
+    assert run_lookup() == "hr@acme.com"
+    assert calls == ["empty", "failed", "hit"]
+
+
+def test_lookup_falls_back_to_domain(monkeypatch):
+    calls = []
+    monkeypatch.setattr(Contact, "PROVIDERS", [
+        make_provider("hunter", calls, ()),
+        make_provider("clearbit_snov", calls, (), domain="acme.com"),
+    ])
+    assert run_lookup() == "acme.com"
+    assert calls == ["hunter", "clearbit_snov"]
+
+
+@pytest.mark.parametrize("domain", [None, ""])
+def test_lookup_falls_back_to_na(monkeypatch, domain):
+    monkeypatch.setattr(Contact, "PROVIDERS", [make_provider("only", [], (), domain=domain)])
+    assert run_lookup() == "N/A"
+
+
+def test_valid_emails_filters_malformed():
+    mails = ["hr@acme.com", "", None, "no-at-sign", "x@nodot", "jobs@acme.co.in"]
+    assert Contact.valid_emails(mails) == ("hr@acme.com", "jobs@acme.co.in")
@@ -0,0 +1,108 @@
+import pytest
+
+from Job_applier import (JobPost, extract_salary_numbers, _salary_meets_cutoff, matches_resume,
+                         canonicalize_link, merge_jobs)
+
+
+def job(role="", company="Acme", location="India", link="", salary="N/A", snippet=""):
+    return JobPost(company=company, role=role, location=location, link=link, source="test",
+                   salary=salary, description_snippet=snippet)
+
+
+# -------------- salary parsing --------------
+@pytest.mark.parametrize("text, expected", [
+    ("₹12,00,000 per annum", (100000.0, "INR", "yearly")),
+    ("$5000 per month", (5000.0, "USD", "monthly")),
+    ("$30000-45000 per year", (2500.0, "USD", "yearly")),
+    ("€4,000 monthly", (4000.0, "EUR", "monthly")),
+    # large INR figures without a unit are taken as annual
+    ("INR 300000", (25000.0, "INR", "monthly")),
+    ("", None),
+    ("competitive", None),
+])
+def test_extract_salary_numbers(text, expected):
+    assert extract_salary_numbers(text) == expected
+
+
+# -------------- salary cutoff --------------
+@pytest.mark.parametrize("salary, location, expected", [
+    ("N/A", "india", True),
+    ("₹80000 per month", "kukatpally, hyderabad, india", True),
+    ("₹50000 per month", "hyderabad, india", False),
+    # "uk"/"us" inside Indian place names must not override "india"
+    ("₹50000 per month", "kukatpally, hyderabad, india", False),
+    ("₹50000 per month", "industrial area, mohali, india", False),
+    ("$3000 per month", "austin, usa", False),
+    ("£3000 per month", "london, uk", True),
+    # no country in the location: cutoff comes from the currency
+    ("₹50000 per month", "remote", False),
+    ("$30000-45000 per year", "remote", False),
+])
+def test_salary_meets_cutoff(salary, location, expected):
+    assert _salary_meets_cutoff(salary, location) is expected
+
+
+# -------------- resume matching --------------
+@pytest.mark.parametrize("role, expected", [
+    ("Machine Learning Engineer", True),
+    ("ROS2 Developer", True),
+    ("Python3 Engineer", True),
+    ("Python-based Backend Engineer", True),
+    ("Embedded-C Developer", True),
+    ("Microcontrollers Firmware Engineer", True),
+    ("ESP32S3 Firmware", True),
+    ("Senior C++ Developer", True),
+    ("Works across teams", False),
+    ("Prose Writer", False),
+    ("Node.js Developer", False),
+])
+def test_matches_resume_role(role, expected):
+    assert matches_resume(job(role=role)) is expected
+
+
+def test_matches_resume_uses_snippet():
+    assert matches_resume(job(role="Engineer", snippet="Build LiDARs pipelines"))
+    assert not matches_resume(job(role="Engineer", snippet="Sales and marketing"))
+
+
+# -------------- dedupe --------------
+def test_canonicalize_link_keeps_indeed_job_ids():
+    a = canonicalize_link("https://www.indeed.com/rc/clk?jk=aaa&from=serp")
+    b = canonicalize_link("https://www.indeed.com/rc/clk?jk=bbb&from=serp")
+    assert a != b
+    assert canonicalize_link("https://www.indeed.com/viewjob?jk=aaa&vjs=3") == "https://www.indeed.com/viewjob?jk=aaa"
+
+
+def test_canonicalize_link_drops_result_position_params():
+    first = canonicalize_link("https://www.linkedin.com/jobs/view/42/?refId=x&position=1&pageNum=0")
+    second = canonicalize_link("https://WWW.linkedin.com/jobs/view/42?trackingId=y&position=7&pageNum=2")
+    assert first == second == "https://www.linkedin.com/jobs/view/42"
+    assert (canonicalize_link("https://www.naukri.com/job-listings-ml-123?src=a&sid=1&xp=1&px=1")
+            == "https://www.naukri.com/job-listings-ml-123")
+
+
+def test_canonicalize_link_other_hosts_keep_query_minus_tracking():
+    assert (canonicalize_link("https://careers.example.com/search/?q=ml&utm_source=x#top")
+            == "https://careers.example.com/search?q=ml")
+    assert canonicalize_link("") == canonicalize_link(None) == ""
+
+
+def test_merge_jobs_dedupes_by_link_keeping_order():
+    a = job(role="ML Engineer", link="https://www.linkedin.com/jobs/view/1?position=1")
+    b = job(role="CV Engineer", link="https://www.indeed.com/viewjob?jk=2")
+    a_again = job(role="ML Engineer (repost)", link="https://www.linkedin.com/jobs/view/1?position=9")
+    c = job(role="Robotics Engineer", link="https://www.indeed.com/viewjob?jk=3")
+    assert merge_jobs([a, b], [a_again, c]) == [a, b, c]
+
+
+def test_merge_jobs_prefers_record_with_salary():
+    bare = job(role="ML Engineer", link="https://www.indeed.com/viewjob?jk=1")
+    paid = job(role="ML Engineer", link="https://www.indeed.com/viewjob?jk=1", salary="₹90000 per month")
+    assert merge_jobs([bare], [paid]) == [paid]
+
+
+def test_merge_jobs_without_link_uses_dedupe_key():
+    x = job(role="ML Engineer", company="Acme")
+    y = job(role="ML Engineer", company="Acme")
+    z = job(role="ML Engineer", company="Other")
+    assert merge_jobs([x, y, z]) == [x, z]